@@ -1,6 +1,8 @@
 """Configuration management for the Agentic API."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -23,6 +25,19 @@ def _get_env_file_path() -> str:
     return str(default_env_file)
 
 
+_ENV_FILE_PATH: Final[str] = _get_env_file_path()
+
+# Settings that must be set for the backend services to be built
+_REQUIRED_RUNTIME_SETTINGS: Final[tuple[str, ...]] = (
+    "azure_cosmosdb_endpoint",
+    "azure_storage_account_name",
+)
+
+
+class ConfigError(ValueError):
+    """Raised when required runtime settings are missing."""
+
+
 class Settings(BaseSettings):
     """Application settings from environment variables."""
 
@@ -58,6 +73,10 @@ class Settings(BaseSettings):
     foundry_endpoint: str | None = None
     # OpenAI Responses API conversation storage (default: False to prevent 30-day retention)
     openai_responses_store: bool = False
+    # Pooled HTTP/2 connections to the Foundry OpenAI endpoint, shared by all chat streams
+    foundry_max_connections: int = 100
+    foundry_max_keepalive_connections: int = 20
+    foundry_keepalive_expiry: float = 60.0
 
     # Azure Service Bus
     azure_servicebus_connection_string: str | None = None
@@ -75,14 +94,45 @@ class Settings(BaseSettings):
     azure_storage_account_key: str | None = "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
     azure_storage_container_name: str = "files"
     azure_storage_blob_endpoint: str | None = None  # For Azurite: http://127.0.0.1:10000/devstoreaccount1
+    azure_storage_connection_pool_size: int = 32  # Keep-alive connections shared by all blob calls
+    azure_storage_max_single_put_size: int = 4 * 1024 * 1024  # Larger files are uploaded in blocks
+    azure_storage_max_block_size: int = 4 * 1024 * 1024
+    azure_storage_max_concurrency: int = 4  # Blocks of one file uploaded in parallel
+
+    # File uploads
+    upload_max_concurrency: int = 8  # Max files uploaded in parallel by the batch endpoint
+    max_upload_bytes: int = 100 * 1024 * 1024  # Larger request bodies are rejected with 413
+
+    # Response compression
+    gzip_minimum_size: int = 2048  # Smaller responses are sent uncompressed
+
+    # Worker threads running blocking Cosmos DB and Blob Storage calls
+    blocking_io_workers: int = 32  # Sized to match the blob connection pool
 
     model_config = SettingsConfigDict(
-        env_file=_get_env_file_path(),
+        env_file=_ENV_FILE_PATH,
         case_sensitive=False,
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
+    def validate_runtime(self) -> None:
+        """Check that every setting required to build the services is present.
+
+        Raises:
+            ConfigError: Listing all missing settings at once
+        """
+        missing = [name.upper() for name in _REQUIRED_RUNTIME_SETTINGS if not getattr(self, name)]
+        if missing:
+            raise ConfigError(f"Missing required settings: {', '.join(missing)}")
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    The settings are parsed once and cached for the lifetime of the process.
+    Call ``get_settings.cache_clear()`` to force a reload (e.g. in tests that
+    modify environment variables).
+    """
     return Settings()
@@ -1,120 +1,192 @@
 """Main FastAPI application."""
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any
 
 from api.config import get_settings
 from api.middleware import get_cors_headers, setup_middleware
-from api.routes import api_router, chat_router_no_prefix
+from api.routes import api_router, chat_router
+from api.services import close_services, initialize_services
 from api.services.cosmos_db_init import initialize_cosmos_db
 from fastapi import FastAPI, Request, status
-from fastapi.exceptions import HTTPException, RequestValidationError
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Disable Cosmos DB INFO logging (only show WARNING and above)
-logging.getLogger("azure.cosmos").setLevel(logging.WARNING)
-logging.getLogger("azure.cosmos._cosmos_http_logging_policy").setLevel(logging.WARNING)
+# Maximum number of request body bytes logged on validation errors
+_LOGGED_BODY_BYTES = 500
 
-# Initialize settings
-settings = get_settings()
+
+def _configure_logging() -> None:
+    """Configure log levels and the root handler."""
+    logging.basicConfig(level=logging.INFO)
+
+    # Disable Cosmos DB INFO logging (only show WARNING and above)
+    logging.getLogger("azure.cosmos").setLevel(logging.WARNING)
+    logging.getLogger("azure.cosmos._cosmos_http_logging_policy").setLevel(logging.WARNING)
+
+
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+    """Hand root log records to a background thread while the app is running.
+
+    Request handlers never block on handler locks or stream writes; the root
+    handlers run on the listener thread. On exit the queue is drained and the
+    original handlers are restored.
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        root_logger.handlers = handlers
+        listener.stop()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Handle application lifespan events."""
-    # Startup
-    logger.info(f"{settings.app_name} v{settings.app_version} started")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Log level: {settings.log_level}")
+    settings = get_settings()
 
-    # Initialize Cosmos DB
-    logger.info("Initializing Cosmos DB...")
-    await initialize_cosmos_db(settings)
+    # asyncio.to_thread runs blocking SDK calls on the loop's default executor;
+    # size it explicitly instead of relying on the CPU-count based default.
+    # Leaving the block shuts it down, so repeated lifespans don't leak worker threads.
+    executor = ThreadPoolExecutor(max_workers=settings.blocking_io_workers, thread_name_prefix="blocking-io")
 
-    yield
+    with _queued_logging(), executor:
+        # Startup
+        asyncio.get_running_loop().set_default_executor(executor)
 
-    # Shutdown
-    logger.info(f"{settings.app_name} shutting down")
+        logger.info("%s v%s started", settings.app_name, settings.app_version)
+        logger.info("Environment: %s", settings.environment)
+        logger.info("Log level: %s", settings.log_level)
 
+        # Initialize Cosmos DB
+        logger.info("Initializing Cosmos DB...")
+        await initialize_cosmos_db(settings)
 
-# Create FastAPI application
-app = FastAPI(
-    title=settings.app_name,
-    description="Agentic AI - FastAPI backend service",
-    version=settings.app_version,
-    lifespan=lifespan,
-    redirect_slashes=False,
-)
+        logger.info("Initializing services...")
+        await initialize_services(app, settings)
+
+        yield
 
-# Setup middleware (must be before exception handlers)
-setup_middleware(app, ui_url=settings.ui_url, environment=settings.environment)
+        # Shutdown
+        logger.info("%s shutting down", settings.app_name)
+        close_services(app)
 
 
-# Request validation error handler
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+def _error_response(request: Request, status_code: int, content: dict[str, Any]) -> JSONResponse:
+    """Build an error response carrying CORS headers for the request origin.
+
+    Args:
+        request: Incoming request
+        status_code: HTTP status code
+        content: JSON response body
+
+    Returns:
+        JSONResponse with CORS headers applied
+    """
+    settings = get_settings()
+    origin = request.headers.get("origin")
+    cors_headers = get_cors_headers(origin, ui_url=settings.ui_url, environment=settings.environment)
+    return JSONResponse(status_code=status_code, content=content, headers=cors_headers)
+
+
+async def validation_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle request validation errors with detailed logging."""
+    # Registered for RequestValidationError only
+    assert isinstance(exc, RequestValidationError)
     errors = exc.errors()
     logger.error("Request validation error on %s %s", request.method, request.url.path)
     for error in errors:
         logger.error("Validation error: %s", error)
-    
-    # Try to log request body if available
-    try:
-        body = await request.body()
-        if body:
-            logger.error("Request body: %s", body.decode("utf-8", errors="replace")[:500])
-    except Exception:
-        pass
-    
-    # Get CORS headers
-    origin = request.headers.get("origin")
-    cors_headers = get_cors_headers(origin, ui_url=settings.ui_url, environment=settings.environment)
-    
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
+
+    # Try to log the start of the request body if available (bounded read, never the full payload)
+    if logger.isEnabledFor(logging.ERROR):
+        try:
+            buf = bytearray()
+            async for chunk in request.stream():
+                buf.extend(chunk)
+                if len(buf) >= _LOGGED_BODY_BYTES:
+                    break
+            if buf:
+                logger.error("Request body: %s", bytes(buf[:_LOGGED_BODY_BYTES]).decode("utf-8", errors="replace"))
+        except Exception:
+            pass
+
+    return _error_response(
+        request,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        {
             "detail": errors,
             "body": str(exc.body) if hasattr(exc, "body") else None,
         },
-        headers=cors_headers,
     )
 
 
-# Exception handler to ensure CORS headers are present on all error responses
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Global exception handler to ensure CORS headers are present on all errors."""
-    # Let FastAPI handle HTTPException normally (CORS middleware handles it)
-    if isinstance(exc, HTTPException):
-        raise exc
-
     logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return _error_response(request, status.HTTP_500_INTERNAL_SERVER_ERROR, {"detail": str(exc)})
 
-    # Get CORS headers using shared function
-    origin = request.headers.get("origin")
-    cors_headers = get_cors_headers(origin, ui_url=settings.ui_url, environment=settings.environment)
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": str(exc)},
-        headers=cors_headers,
+def create_app() -> FastAPI:
+    """Create the FastAPI application.
+
+    Returns:
+        Configured FastAPI application
+    """
+    _configure_logging()
+    settings = get_settings()
+
+    application = FastAPI(
+        title=settings.app_name,
+        description="Agentic AI - FastAPI backend service",
+        version=settings.app_version,
+        lifespan=lifespan,
+        redirect_slashes=False,
     )
 
+    # Setup middleware (must be before exception handlers)
+    setup_middleware(
+        application,
+        ui_url=settings.ui_url,
+        environment=settings.environment,
+        max_body_bytes=settings.max_upload_bytes,
+        gzip_minimum_size=settings.gzip_minimum_size,
+    )
+
+    # Exception handlers (the global one ensures CORS headers are present on all error responses)
+    application.add_exception_handler(RequestValidationError, validation_exception_handler)
+    application.add_exception_handler(Exception, global_exception_handler)
 
-# Include routers
-app.include_router(api_router)
-app.include_router(chat_router_no_prefix)
+    # Include routers
+    application.include_router(api_router)
+    application.include_router(chat_router)
+
+    return application
+
+
+# Create FastAPI application
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
+
     uvicorn.run(
         "api.main:app",
         host=settings.api_host,
@@ -1,35 +1,55 @@
 """Middleware setup for the FastAPI application."""
 
 import logging
+from functools import lru_cache
+from typing import Final
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+# Environment names that allow local development origins
+_DEV_ENVS: Final[frozenset[str]] = frozenset({"development", "dev", "local"})
 
-def get_allowed_origins(ui_url: str | None = None, environment: str = "development") -> list[str]:
-    """Get list of allowed CORS origins based on configuration.
+# Static CORS headers added alongside the echoed origin on allowed requests
+_CORS_HEADERS_TEMPLATE: dict[str, str] = {
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+
+@lru_cache(maxsize=8)
+def get_allowed_origins(ui_url: str | None = None, environment: str = "development") -> tuple[str, ...]:
+    """Get allowed CORS origins based on configuration.
+
+    Results are cached per ``(ui_url, environment)`` pair.
 
     Args:
         ui_url: URL of the UI application (from container apps or env var)
         environment: Environment name (development, production, etc.)
 
     Returns:
-        List of allowed origin URLs
+        Tuple of allowed origin URLs
     """
     allowed_origins: list[str] = []
 
     # Add configured UI URL (if provided)
     if ui_url:
-        allowed_origins.append(ui_url.rstrip("/"))
-        if ui_url.startswith("http://"):
-            allowed_origins.append(ui_url.replace("http://", "https://", 1).rstrip("/"))
-        if ui_url.startswith("https://"):
-            allowed_origins.append(ui_url.replace("https://", "http://", 1).rstrip("/"))
+        stripped = ui_url.rstrip("/")
+        allowed_origins.append(stripped)
+        # Allow the same host over the other scheme
+        if stripped.startswith("http://"):
+            allowed_origins.append("https://" + stripped[7:])
+        elif stripped.startswith("https://"):
+            allowed_origins.append("http://" + stripped[8:])
 
     # Dev/local origins (Vite commonly uses both)
-    if environment.lower() in {"development", "dev", "local"}:
+    if environment.lower() in _DEV_ENVS:
         allowed_origins.extend(
             [
                 "http://localhost:5173",
@@ -40,7 +60,13 @@ def get_allowed_origins(ui_url: str | None = None, environment: str = "developme
         )
 
     # Deduplicate while preserving order
-    return list(dict.fromkeys(allowed_origins))
+    return tuple(dict.fromkeys(allowed_origins))
+
+
+@lru_cache(maxsize=8)
+def _allowed_origins_set(ui_url: str | None, environment: str) -> frozenset[str]:
+    """Get allowed CORS origins as a frozenset for O(1) membership checks."""
+    return frozenset(get_allowed_origins(ui_url, environment))
 
 
 def get_cors_headers(origin: str | None, ui_url: str | None = None, environment: str = "development") -> dict[str, str]:
@@ -57,32 +83,96 @@ def get_cors_headers(origin: str | None, ui_url: str | None = None, environment:
     if not origin:
         return {}
 
-    allowed_origins = get_allowed_origins(ui_url, environment)
-
     # Check if origin is allowed
-    if origin in allowed_origins:
-        return {
-            "Access-Control-Allow-Origin": origin,
-            "Access-Control-Allow-Credentials": "true",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
-        }
+    if origin in _allowed_origins_set(ui_url, environment):
+        headers = _CORS_HEADERS_TEMPLATE.copy()
+        headers["Access-Control-Allow-Origin"] = origin
+        return headers
     return {}
 
 
-def setup_middleware(app: FastAPI, ui_url: str | None = None, environment: str = "development") -> None:
+class RequestSizeLimitMiddleware:
+    """Reject requests whose body exceeds a limit with 413.
+
+    A declared Content-Length is checked before the body is read; bodies sent
+    without one (chunked transfer encoding) are counted as they stream in and
+    cut off as soon as they pass the limit.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_body_bytes: Largest accepted request body in bytes
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    response = JSONResponse(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        content={"detail": self._detail()},
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised inside the app, so the exception handlers turn it into the 413 response
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        """Build the 413 error detail."""
+        return f"Request body exceeds {self.max_body_bytes} bytes"
+
+
+def setup_middleware(
+    app: FastAPI,
+    ui_url: str | None = None,
+    environment: str = "development",
+    max_body_bytes: int | None = None,
+    gzip_minimum_size: int | None = None,
+) -> None:
     """Setup middleware for the FastAPI application.
 
     Args:
         app: FastAPI application instance
         ui_url: URL of the UI application for CORS (from container apps or local)
         environment: Environment name (development, production, etc.)
+        max_body_bytes: Largest accepted request body in bytes (no limit if None)
+        gzip_minimum_size: Smallest response in bytes that is gzip-compressed (disabled if None)
     """
     allowed_origins = get_allowed_origins(ui_url, environment)
 
+    # Innermost, so only response bodies are compressed; Starlette skips text/event-stream
+    if gzip_minimum_size is not None:
+        app.add_middleware(GZipMiddleware, minimum_size=gzip_minimum_size)
+
+    # Added before CORS so that rejected requests still get CORS headers
+    if max_body_bytes is not None:
+        app.add_middleware(RequestSizeLimitMiddleware, max_body_bytes=max_body_bytes)
+
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,
+        allow_origins=list(allowed_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -13,9 +13,7 @@ api_router = APIRouter(prefix="/api", redirect_slashes=False)
 api_router.include_router(health_router)
 api_router.include_router(user_router)
 
-# Include chat router at root level (no /api prefix for v1 routes)
-chat_router_no_prefix = APIRouter(redirect_slashes=False)
-chat_router_no_prefix.include_router(chat_router)
+# The chat router is mounted directly on the app at root level (no /api prefix for v1 routes)
 
 
-__all__ = ["api_router", "chat_router_no_prefix"]
+__all__ = ["api_router", "chat_router"]
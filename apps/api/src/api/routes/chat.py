@@ -1,14 +1,18 @@
 """Chat routes for streaming conversations."""
 
+import asyncio
+import hashlib
 import logging
 import mimetypes
 import os
-import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from typing import BinaryIO
 
 from api.config import Settings, get_settings
-from api.services import get_chat_store, get_file_storage, get_tool_registry
+from api.services import get_chat_store, get_file_storage, get_foundry_client, get_tool_registry
 from api.services.chat_service import ChatService
 from api.services.foundry_client import FoundryClient
+from common.ids import new_id
 from common.models.chat import ChatRequest, FileUploadResponse, ParameterRequest, ToolApprovalRequest
 from common.services.chat_store import ChatStore
 from common.services.file_storage import FileStorage
@@ -20,20 +24,121 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1", tags=["chat"], redirect_slashes=False)
 
+# SSE response headers, encoded once at import
+_SSE_RAW_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"cache-control", b"no-cache"),
+    (b"connection", b"keep-alive"),
+    (b"x-accel-buffering", b"no"),
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+)
 
-def get_foundry_client(settings: Settings = Depends(get_settings)) -> FoundryClient:
-    """Get Foundry client dependency.
 
-    Args:
-        settings: Application settings
+class SSEResponse(StreamingResponse):
+    """Streaming response for server-sent events with pre-encoded headers."""
 
-    Returns:
-        FoundryClient instance
+    media_type = "text/event-stream"
+
+    def init_headers(self, headers: Mapping[str, str] | None = None) -> None:
+        """Start from the constant SSE headers instead of re-encoding them per response.
+
+        Args:
+            headers: Optional extra headers
+        """
+        # Middleware may append to raw_headers, so each response gets its own list
+        self.raw_headers = list(_SSE_RAW_HEADERS)
+        if headers:
+            self.raw_headers.extend((k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items())
+
+
+# Content types for common upload extensions, checked before falling back to mimetypes
+_CONTENT_TYPE_MAP: dict[str, str] = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".txt": "text/plain",
+    ".csv": "text/csv",
+    ".json": "application/json",
+}
+
+# Bytes read at a time when hashing an upload
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of SSE events buffered ahead of a slow client
+_SSE_QUEUE_SIZE = 64
+_SSE_END = object()
+
+
+async def _pump_events(events: AsyncGenerator[str, None], queue: asyncio.Queue, slots: asyncio.Semaphore) -> None:
+    """Copy events into the queue, always followed by an end marker or the raised exception.
+
+    Args:
+        events: Source SSE event stream, closed when pumping stops
+        queue: Unbounded queue shared with the consumer
+        slots: Free buffer slots; acquired per event and released by the consumer
     """
-    return FoundryClient(settings)
+    end: object = _SSE_END
+    try:
+        async for event in events:
+            await slots.acquire()
+            queue.put_nowait(event)
+    except BaseException as e:
+        # Includes cancellation, so the consumer is never left waiting
+        end = e
+        raise
+    finally:
+        try:
+            await events.aclose()
+        finally:
+            queue.put_nowait(end)
+
+
+async def _coalesce_events(events: AsyncGenerator[str, None], maxsize: int = _SSE_QUEUE_SIZE) -> AsyncIterator[str]:
+    """Stream SSE events, merging the ones that pile up while the client is slow.
+
+    The source is consumed by a background task that runs ahead of the socket
+    by at most ``maxsize`` events. Every event that is already queued when the
+    client is ready is sent in a single write. When the client goes away, the
+    task is cancelled and the source generator is closed.
 
+    Args:
+        events: Source SSE event stream
+        maxsize: Maximum number of events buffered ahead of the client
 
-def get_chat_service(
+    Yields:
+        One or more concatenated SSE events
+    """
+    # The queue itself is unbounded so the end marker always fits; slots bound the events
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(maxsize)
+    producer = asyncio.create_task(_pump_events(events, queue, slots))
+    try:
+        while True:
+            item = await queue.get()
+            chunks: list[str] = []
+            while isinstance(item, str):
+                chunks.append(item)
+                slots.release()
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    item = None
+                    break
+            if chunks:
+                yield "".join(chunks)
+            if item is _SSE_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+    finally:
+        producer.cancel()
+        # Let the producer close the source before the response finishes
+        await asyncio.wait([producer])
+
+
+async def get_chat_service(
     foundry_client: FoundryClient = Depends(get_foundry_client),
     settings: Settings = Depends(get_settings),
     chat_store: ChatStore = Depends(get_chat_store),
@@ -57,6 +162,91 @@ def get_chat_service(
     )
 
 
+def _get_upload_size(file: UploadFile) -> int:
+    """Get the size of an uploaded file without reading its content.
+
+    Args:
+        file: Uploaded file
+
+    Returns:
+        File size in bytes
+    """
+    if file.size is not None:
+        return file.size
+    # Fall back to seeking the underlying spooled file
+    position = file.file.tell()
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(position)
+    return size
+
+
+def _build_upload_metadata(file: UploadFile) -> FileUploadResponse:
+    """Build file metadata for an upload without reading its content.
+
+    Args:
+        file: Uploaded file
+
+    Returns:
+        File metadata with a newly generated file ID
+    """
+    filename = file.filename or ""
+
+    # Extract extension from original filename (os.path.splitext safely extracts just the extension)
+    ext = os.path.splitext(filename)[1].lower().strip()
+
+    # Determine content type: use provided, look up or guess from filename, or default
+    content_type = file.content_type
+    if not content_type and ext:
+        content_type = _CONTENT_TYPE_MAP.get(ext) or mimetypes.guess_type(filename)[0]
+    if not content_type:
+        content_type = "application/octet-stream"
+
+    # Generate file ID with extension preserved (limited in length to prevent abuse)
+    file_id = f"{new_id()}{ext[:20]}"
+
+    return FileUploadResponse(
+        file_id=file_id,
+        filename=filename or "unknown",
+        content_type=content_type,
+        size=_get_upload_size(file),
+    )
+
+
+def _store_upload(
+    file_data: FileUploadResponse, stream: BinaryIO, file_storage: FileStorage, chat_store: ChatStore
+) -> FileUploadResponse:
+    """Upload file content to Blob Storage and record its metadata in Cosmos DB.
+
+    Content that was already uploaded is not written again; the metadata of
+    the existing file is returned instead, so the response matches what
+    ``ChatStore.get_file`` returns for that file ID.
+
+    Args:
+        file_data: File metadata
+        stream: Readable stream positioned at the start of the content
+        file_storage: Blob Storage file service
+        chat_store: Chat store for metadata
+
+    Returns:
+        Metadata of the stored file
+    """
+    # Hashing the local spooled file is far cheaper than re-uploading it
+    digest = hashlib.sha256()
+    while chunk := stream.read(_HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    content_hash = digest.hexdigest()
+
+    existing = chat_store.find_file_by_hash(content_hash)
+    if existing is not None:
+        logger.info("Reusing file %s with identical content", existing.file_id)
+        return existing
+
+    stream.seek(0)
+    file_storage.upload_file(file_data.file_id, stream, file_data)
+    chat_store.store_file(file_data.file_id, file_data, content_hash=content_hash)
+    return file_data
+
+
 @router.post("/files", response_model=FileUploadResponse)
 async def upload_file(
     file: UploadFile = FastAPIFile(...),
@@ -74,48 +264,14 @@ async def upload_file(
         File upload response with file ID
     """
     try:
-        # Read file content
-        content = await file.read()
-
-        # Determine content type: use provided, guess from filename, or default
-        content_type = file.content_type
-        if not content_type and file.filename:
-            content_type, _ = mimetypes.guess_type(file.filename)
-        if not content_type:
-            content_type = "application/octet-stream"
-
-        # Generate file ID with extension preserved
-        base_file_id = str(uuid.uuid4())
-        if file.filename:
-            # Extract extension from original filename (os.path.splitext safely extracts just the extension)
-            _, ext = os.path.splitext(file.filename)
-            # Normalize extension: lowercase and limit length for safety
-            if ext:
-                ext = ext.lower().strip()
-                # Limit extension length to prevent abuse
-                if len(ext) > 20:
-                    ext = ext[:20]
-                file_id = f"{base_file_id}{ext}"
-            else:
-                file_id = base_file_id
-        else:
-            file_id = base_file_id
-
-        # Store metadata
-        file_data = FileUploadResponse(
-            file_id=file_id,
-            filename=file.filename or "unknown",
-            content_type=content_type,
-            size=len(content),
-        )
-
-        # Upload to Blob Storage
-        file_storage.upload_file(file_id, content, file_data)
-
-        # Store metadata in Cosmos DB
-        chat_store.store_file(file_id, file_data)
-
-        logger.info("Uploaded file %s: %s", file_id, file.filename)
+        # Stream the spooled upload instead of reading it into memory
+        await file.seek(0)
+        file_data = _build_upload_metadata(file)
+
+        # Blob and Cosmos SDK calls are blocking; keep them off the event loop
+        file_data = await asyncio.to_thread(_store_upload, file_data, file.file, file_storage, chat_store)
+
+        logger.info("Uploaded file %s: %s", file_data.file_id, file.filename)
         return file_data
 
     except Exception as e:
@@ -123,12 +279,48 @@ async def upload_file(
         raise HTTPException(status_code=500, detail=f"File upload failed: {e!s}")
 
 
+@router.post("/files/batch", response_model=list[FileUploadResponse])
+async def upload_files_batch(
+    files: list[UploadFile] = FastAPIFile(...),
+    settings: Settings = Depends(get_settings),
+    file_storage: FileStorage = Depends(get_file_storage),
+    chat_store: ChatStore = Depends(get_chat_store),
+) -> list[FileUploadResponse]:
+    """Upload several files concurrently.
+
+    Args:
+        files: Uploaded files
+        settings: Application settings
+        file_storage: Blob Storage file service
+        chat_store: Chat store for metadata
+
+    Returns:
+        File upload responses in the same order as the uploaded files
+    """
+    semaphore = asyncio.Semaphore(settings.upload_max_concurrency)
+
+    async def upload_one(file: UploadFile) -> FileUploadResponse:
+        async with semaphore:
+            await file.seek(0)
+            file_data = _build_upload_metadata(file)
+            file_data = await asyncio.to_thread(_store_upload, file_data, file.file, file_storage, chat_store)
+            logger.info("Uploaded file %s: %s", file_data.file_id, file.filename)
+            return file_data
+
+    try:
+        return list(await asyncio.gather(*(upload_one(file) for file in files)))
+
+    except Exception as e:
+        logger.error("Error uploading files: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"File upload failed: {e!s}")
+
+
 @router.post("/chat/stream")
 async def stream_chat(
     request: ChatRequest,
     chat_service: ChatService = Depends(get_chat_service),
     chat_store: ChatStore = Depends(get_chat_store),
-) -> StreamingResponse:
+) -> SSEResponse:
     """Stream chat completion with SSE.
 
     Args:
@@ -137,15 +329,12 @@ async def stream_chat(
         chat_store: Chat store
 
     Returns:
-        StreamingResponse with SSE events
+        SSEResponse with SSE events
     """
     try:
-        # Create run - returns both run_id and conversation_id
-        run_id, conversation_id = chat_store.create_run(request.thread_id)
-
-        # Store initial messages
-        for msg in request.messages:
-            chat_store.add_message(run_id, msg, conversation_id=conversation_id)
+        # Create run with its initial messages - returns both run_id and conversation_id
+        # (Cosmos SDK calls are blocking; keep them off the event loop)
+        run_id, conversation_id = await asyncio.to_thread(chat_store.start_run, request.thread_id, request.messages)
 
         # Collect file IDs: use top-level file_ids if provided, otherwise collect from messages
         file_ids = request.file_ids or []
@@ -160,22 +349,9 @@ async def stream_chat(
             file_ids = list(dict.fromkeys(file_ids))
         logger.info("Final file_ids to process: %s", file_ids)
 
-        # Start streaming
-        async def event_generator():
-            async for event in chat_service.stream_chat(
-                run_id, request.messages, file_ids, conversation_id=conversation_id
-            ):
-                yield event
-
-        return StreamingResponse(
-            event_generator(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
-        )
+        # Start streaming (the service's async generator is consumed directly, no per-request wrapper)
+        events = chat_service.stream_chat(run_id, request.messages, file_ids, conversation_id=conversation_id)
+        return SSEResponse(_coalesce_events(events))
 
     except Exception as e:
         logger.error("Error in stream_chat: %s", e, exc_info=True)
@@ -196,7 +372,7 @@ async def stop_run(
     Returns:
         Success message
     """
-    chat_store.cancel_run(run_id)
+    await asyncio.to_thread(chat_store.cancel_run, run_id)
     logger.info("Stopped run %s", run_id)
     return {"status": "cancelled", "runId": run_id}
 
@@ -219,7 +395,9 @@ async def approve_tool_call(
     Returns:
         Success message
     """
-    chat_store.approve_tool_call(run_id, tool_call_id, request.approved, partition_key=request.partition_key)
+    await asyncio.to_thread(
+        chat_store.approve_tool_call, run_id, tool_call_id, request.approved, partition_key=request.partition_key
+    )
     logger.info(
         "Tool call %s in run %s %s",
         tool_call_id,
@@ -251,7 +429,7 @@ async def provide_parameters(
     Returns:
         Success message
     """
-    chat_store.provide_parameters(run_id, tool_call_id, request.parameters)
+    await asyncio.to_thread(chat_store.provide_parameters, run_id, tool_call_id, request.parameters)
     logger.info(
         "Provided parameters for tool call %s in run %s: %s",
         tool_call_id,
@@ -2,28 +2,34 @@
 
 from api.config import Settings, get_settings
 from api.models.health import HealthCheckResponse
-from api.services.foundry_client import FoundryClient
-from fastapi import APIRouter, Depends
+from api.services import Services
+from fastapi import APIRouter, Depends, Request
 
 router = APIRouter(tags=["health"], redirect_slashes=False)
 
 
 @router.get("/health", response_model=HealthCheckResponse)
-async def health_check(
-    settings: Settings = Depends(get_settings),
-) -> HealthCheckResponse:
+async def health_check(request: Request, settings: Settings = Depends(get_settings)) -> HealthCheckResponse:
     """Health check endpoint.
 
+    Reads the services without depending on them, so the endpoint keeps
+    answering when they failed to initialize and reports a degraded status.
+
     Returns:
         HealthCheckResponse with status and version information
     """
-    # Check Foundry configuration
-    foundry_client = FoundryClient(settings)
-    foundry_configured = foundry_client.is_configured()
+    services: Services | None = getattr(request.app.state, "services", None)
+    if services is None:
+        return HealthCheckResponse(
+            status="degraded",
+            version=settings.app_version,
+            environment=settings.environment,
+            message="Backend services are not configured",
+        )
 
     return HealthCheckResponse(
         status="ok",
         version=settings.app_version,
         environment=settings.environment,
-        foundry_configured=foundry_configured,
+        foundry_configured=services.foundry_client.is_configured(),
     )
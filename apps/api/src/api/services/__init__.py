@@ -1,113 +1,274 @@
 """Service initialization and dependency injection."""
 
+import asyncio
 import logging
+from dataclasses import dataclass
 
-from api.config import Settings, get_settings
+from api.config import ConfigError, Settings
+from api.middleware import _DEV_ENVS
+from api.services.foundry_client import FoundryClient
 from api.services.tool_registry import ToolRegistry
+from azure.cosmos import ContainerProxy, CosmosClient
+from azure.identity import DefaultAzureCredential
 from common.services.chat_store import CosmosChatStore
 from common.services.file_storage import BlobFileStorage
 from common.services.user_service import CosmosUserService
-from fastapi import Depends
+from fastapi import FastAPI, HTTPException, Request, status
 
 logger = logging.getLogger(__name__)
 
-# Service instances cache
-_services_cache = {}
+__all__ = [
+    "Services",
+    "build_services",
+    "close_services",
+    "get_chat_store",
+    "get_file_storage",
+    "get_foundry_client",
+    "get_tool_registry",
+    "get_user_service",
+    "initialize_services",
+]
 
 
-def get_chat_store(settings: Settings = Depends(get_settings)) -> CosmosChatStore:
-    """Get Cosmos DB chat store instance.
+@dataclass(frozen=True, slots=True)
+class Services:
+    """Process-wide service instances, built once during application startup."""
+
+    chat_store: CosmosChatStore
+    user_service: CosmosUserService
+    file_storage: BlobFileStorage
+    tool_registry: ToolRegistry
+    foundry_client: FoundryClient
+    cosmos_client: CosmosClient
+    credential: DefaultAzureCredential
+
+
+def build_services(settings: Settings) -> Services:
+    """Construct all services from the application settings.
 
     Args:
         settings: Application settings
 
     Returns:
-        CosmosChatStore instance
+        Services container
+
+    Raises:
+        ConfigError: If required settings are missing
     """
-    if "chat_store" not in _services_cache:
-        if not settings.azure_cosmosdb_endpoint:
-            raise ValueError("AZURE_COSMOSDB_ENDPOINT is required")
-
-        use_managed_identity = settings.azure_cosmosdb_key is None
-
-        _services_cache["chat_store"] = CosmosChatStore(
-            cosmos_endpoint=settings.azure_cosmosdb_endpoint,
-            cosmos_key=settings.azure_cosmosdb_key,
-            database_name=settings.database_name,
-            agent_store_container_name=settings.cosmos_agent_store_container,
-            default_tenant_id=settings.default_tenant_id,
-            use_managed_identity=use_managed_identity,
-        )
-        logger.info("Initialized CosmosChatStore")
+    settings.validate_runtime()
+    cosmos_endpoint = settings.azure_cosmosdb_endpoint
+    storage_account_name = settings.azure_storage_account_name
+    if not cosmos_endpoint or not storage_account_name:
+        # Unreachable after validate_runtime; narrows the settings to str
+        raise ConfigError("Missing required settings")
+
+    # One credential for every managed-identity client, so the chain is probed and
+    # tokens are cached once instead of per service
+    credential = DefaultAzureCredential()
+
+    # One client per endpoint, so both stores share its connection pool and metadata caches
+    cosmos_credential = credential if settings.azure_cosmosdb_key is None else settings.azure_cosmosdb_key
+    cosmos_client = CosmosClient(cosmos_endpoint, cosmos_credential)
+
+    chat_store = CosmosChatStore(
+        database_name=settings.database_name,
+        agent_store_container_name=settings.cosmos_agent_store_container,
+        default_tenant_id=settings.default_tenant_id,
+        client=cosmos_client,
+    )
+    logger.info("Initialized CosmosChatStore")
+
+    user_service = CosmosUserService(
+        database_name=settings.database_name,
+        container_name=settings.cosmos_users_container,
+        client=cosmos_client,
+    )
+    logger.info("Initialized CosmosUserService")
+
+    file_storage = BlobFileStorage(
+        account_name=storage_account_name,
+        account_key=settings.azure_storage_account_key,
+        container_name=settings.azure_storage_container_name,
+        use_managed_identity=settings.azure_storage_account_key is None,
+        blob_endpoint=settings.azure_storage_blob_endpoint,
+        connection_pool_size=settings.azure_storage_connection_pool_size,
+        max_single_put_size=settings.azure_storage_max_single_put_size,
+        max_block_size=settings.azure_storage_max_block_size,
+        max_concurrency=settings.azure_storage_max_concurrency,
+        credential=credential,
+    )
+    logger.info("Initialized BlobFileStorage")
+
+    tool_registry = ToolRegistry(user_service=user_service)
+    logger.info("Initialized ToolRegistry with UserService")
+
+    foundry_client = FoundryClient(settings, credential=credential)
+    logger.info("Initialized FoundryClient")
+
+    return Services(
+        chat_store=chat_store,
+        user_service=user_service,
+        file_storage=file_storage,
+        tool_registry=tool_registry,
+        foundry_client=foundry_client,
+        cosmos_client=cosmos_client,
+        credential=credential,
+    )
+
+
+def _warm_up_container(container: ContainerProxy) -> None:
+    """Prime a Cosmos container's caches and connections.
+
+    A drained cross-partition query makes the SDK load the partition key range
+    cache and open connections to the physical partitions up front.
+
+    Args:
+        container: Cosmos container to warm up
+    """
+    container.read()
+    list(container.query_items("SELECT TOP 1 c.id FROM c", enable_cross_partition_query=True))
+
+
+def _get_services(request: Request) -> Services:
+    """Get the services published on the app state during startup.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Services container
+
+    Raises:
+        HTTPException: 503 if the services could not be initialized
+    """
+    services: Services | None = getattr(request.app.state, "services", None)
+    if services is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Backend services are unavailable")
+    return services
 
-    return _services_cache["chat_store"]
 
+async def get_chat_store(request: Request) -> CosmosChatStore:
+    """Get Cosmos DB chat store instance.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        CosmosChatStore instance
+    """
+    return _get_services(request).chat_store
 
-def get_user_service(settings: Settings = Depends(get_settings)) -> CosmosUserService:
+
+async def get_user_service(request: Request) -> CosmosUserService:
     """Get Cosmos DB user service instance.
 
     Args:
-        settings: Application settings
+        request: Incoming request
 
     Returns:
         CosmosUserService instance
     """
-    if "user_service" not in _services_cache:
-        if not settings.azure_cosmosdb_endpoint:
-            raise ValueError("AZURE_COSMOSDB_ENDPOINT is required")
-
-        use_managed_identity = settings.azure_cosmosdb_key is None
-
-        _services_cache["user_service"] = CosmosUserService(
-            cosmos_endpoint=settings.azure_cosmosdb_endpoint,
-            cosmos_key=settings.azure_cosmosdb_key,
-            database_name=settings.database_name,
-            container_name=settings.cosmos_users_container,
-            use_managed_identity=use_managed_identity,
-        )
-        logger.info("Initialized CosmosUserService")
+    return _get_services(request).user_service
 
-    return _services_cache["user_service"]
 
-
-def get_file_storage(settings: Settings = Depends(get_settings)) -> BlobFileStorage:
+async def get_file_storage(request: Request) -> BlobFileStorage:
     """Get Blob Storage file service instance.
 
     Args:
-        settings: Application settings
+        request: Incoming request
 
     Returns:
         BlobFileStorage instance
     """
-    if "file_storage" not in _services_cache:
-        if not settings.azure_storage_account_name:
-            raise ValueError("AZURE_STORAGE_ACCOUNT_NAME is required")
-
-        use_managed_identity = settings.azure_storage_account_key is None
-
-        _services_cache["file_storage"] = BlobFileStorage(
-            account_name=settings.azure_storage_account_name,
-            account_key=settings.azure_storage_account_key,
-            container_name=settings.azure_storage_container_name,
-            use_managed_identity=use_managed_identity,
-            blob_endpoint=settings.azure_storage_blob_endpoint,
-        )
-        logger.info("Initialized BlobFileStorage")
-
-    return _services_cache["file_storage"]
+    return _get_services(request).file_storage
 
 
-def get_tool_registry(settings: Settings = Depends(get_settings)) -> ToolRegistry:
+async def get_tool_registry(request: Request) -> ToolRegistry:
     """Get ToolRegistry instance with UserService configured.
 
     Args:
-        settings: Application settings
+        request: Incoming request
 
     Returns:
         ToolRegistry instance with UserService
     """
-    if "tool_registry" not in _services_cache:
-        user_service = get_user_service(settings)
-        _services_cache["tool_registry"] = ToolRegistry(user_service=user_service)
-        logger.info("Initialized ToolRegistry with UserService")
-    return _services_cache["tool_registry"]
+    return _get_services(request).tool_registry
+
+
+async def get_foundry_client(request: Request) -> FoundryClient:
+    """Get Foundry client instance shared across requests.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        FoundryClient instance
+    """
+    return _get_services(request).foundry_client
+
+
+async def initialize_services(app: FastAPI, settings: Settings) -> None:
+    """Build the services, prime their connections and publish them on ``app.state``.
+
+    Construction and the first round trip to each backend happen before the
+    app serves requests instead of on the first request that needs them.
+    Outside development environments a failure aborts startup.
+
+    Args:
+        app: FastAPI application
+        settings: Application settings
+    """
+    try:
+        services = await asyncio.to_thread(build_services, settings)
+    except Exception as e:
+        logger.error("Failed to initialize services: %s", e)
+        if settings.environment.lower() not in _DEV_ENVS:
+            raise
+        # In development, keep serving: health reports degraded and dependent routes return 503
+        logger.warning("Continuing without services (development mode)")
+        app.state.services = None
+        return
+
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(_warm_up_container, services.chat_store.agent_store_container),
+            asyncio.to_thread(_warm_up_container, services.user_service.container),
+            asyncio.to_thread(services.file_storage.container_client.get_container_properties),
+        )
+    except Exception as e:
+        logger.error("Failed to warm up services: %s", e)
+        if settings.environment.lower() not in _DEV_ENVS:
+            _close(services)
+            raise
+        # The clients exist, so they are still published and connect on first use
+        logger.warning("Continuing without service warmup (development mode)")
+
+    app.state.services = services
+    logger.info("Services initialized")
+
+
+def _close(services: Services) -> None:
+    """Close the services that hold network connections.
+
+    Args:
+        services: Services container
+    """
+    services.foundry_client.close()
+    logger.info("Closed FoundryClient")
+    services.file_storage.close()
+    logger.info("Closed BlobFileStorage")
+    # CosmosClient.close() only exists in newer SDKs; exiting the context works on every supported version
+    services.cosmos_client.__exit__(None, None, None)
+    logger.info("Closed CosmosClient")
+    services.credential.close()
+
+
+def close_services(app: FastAPI) -> None:
+    """Close the services published on the app state, if any.
+
+    Args:
+        app: FastAPI application
+    """
+    services: Services | None = getattr(app.state, "services", None)
+    if services is not None:
+        _close(services)
@@ -7,6 +7,7 @@ from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from api.config import Settings
 from api.services.file_processor import FileProcessor
 from api.services.foundry_client import FoundryClient
@@ -113,8 +114,10 @@ class ChatService:
             # Get tools schema for Responses API
             tools = self.tool_registry.get_responses_api_tools_schema()
             chat_history = self.chat_store.get_messages(run_id, conversation_id=conversation_id)
+            # Load attached files once; they are reused if a tool call needs a follow-up request
+            file_content_items = await self._load_file_content_items(file_ids)
             # chat_history = chat_history + messages
-            chat_history_messages = self._convert_messages_for_responses_api(chat_history, file_ids)
+            chat_history_messages = self._convert_messages_for_responses_api(chat_history, file_content_items)
             # Stream completion using Responses API
             stream = client.responses.create(
                 model=self.settings.foundry_deployment_name,
@@ -202,8 +205,8 @@ class ChatService:
 
                     # Validate parameters BEFORE emitting tool_call_requested event
                     try:
-                        arguments = json.loads(tool_call.arguments_json) if tool_call.arguments_json else {}
-                    except json.JSONDecodeError:
+                        arguments = orjson.loads(tool_call.arguments_json) if tool_call.arguments_json else {}
+                    except orjson.JSONDecodeError:
                         arguments = {}
 
                     is_valid, missing_params = self.tool_registry.validate_parameters(tool_call.name, arguments)
@@ -397,7 +400,7 @@ class ChatService:
 
                                 # Convert to Responses API format for the next call
                                 responses_messages2 = self._convert_messages_for_responses_api(
-                                    updated_messages, file_ids
+                                    updated_messages, file_content_items
                                 )
 
                                 # Make another streaming call with tool result using Responses API
@@ -561,7 +564,7 @@ class ChatService:
             yield self._format_sse_event("done", event_data)
 
         except Exception as e:
-            logger.error(f"Error in stream_chat: {e}", exc_info=True)
+            logger.error("Error in stream_chat: %s", e, exc_info=True)
             self.chat_store.error_run(run_id)
             yield self._format_sse_event("error", {"runId": run_id, "message": str(e)})
 
@@ -596,8 +599,30 @@ class ChatService:
 
         return openai_messages
 
+    async def _load_file_content_items(self, file_ids: list[str]) -> list[dict[str, Any]]:
+        """Load attached files as Responses API content items, concurrently.
+
+        Each file needs a metadata query and a blob download; these blocking calls
+        run in worker threads so that the round-trips overlap.
+
+        Args:
+            file_ids: List of attached file IDs
+
+        Returns:
+            Content items for the files that could be processed, in file_ids order
+        """
+        if not file_ids:
+            return []
+        file_items = await asyncio.gather(
+            *(
+                asyncio.to_thread(FileProcessor.process_file, file_id, self.file_storage, self.chat_store)
+                for file_id in file_ids
+            )
+        )
+        return [file_item for file_item in file_items if file_item]
+
     def _convert_messages_for_responses_api(
-        self, messages: list[ChatMessage], file_ids: list[str]
+        self, messages: list[ChatMessage], file_content_items: list[dict[str, Any]]
     ) -> list[EasyInputMessage | dict[str, Any]]:
         """Convert messages to Responses API format, including function calls and outputs.
 
@@ -608,21 +633,13 @@ class ChatService:
 
         Args:
             messages: List of chat messages (may include function calls in content_items)
-            file_ids: List of attached file IDs
+            file_content_items: Content items for attached files (see _load_file_content_items)
 
         Returns:
             List of EasyInputMessage objects and/or dictionaries for function calls/outputs
         """
         responses_messages: list[EasyInputMessage | dict[str, Any]] = []
 
-        # Process files if present
-        file_content_items: list[dict[str, Any]] = []
-        if file_ids:
-            for file_id in file_ids:
-                file_item = FileProcessor.process_file(file_id, self.file_storage, self.chat_store)
-                if file_item:
-                    file_content_items.append(file_item)
-
         # First pass: convert all messages without files
         # We'll attach files to the last user message in a second pass
         for msg in messages:
@@ -1094,7 +1111,7 @@ class ChatService:
                         explanation_text = "\n".join(lines[1:-1]) if len(lines) > 2 else explanation_text
                     explanations = json.loads(explanation_text)
                 except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning(f"Failed to parse LLM explanation as JSON: {e}")
+                    logger.warning("Failed to parse LLM explanation as JSON: %s", e)
                     # Fallback: create a simple explanation from the text
                     for param_name in missing_params:
                         explanations[param_name] = explanation_text
@@ -1102,7 +1119,7 @@ class ChatService:
             return explanations
 
         except Exception as e:
-            logger.error(f"Error getting parameter explanations from LLM: {e}", exc_info=True)
+            logger.error("Error getting parameter explanations from LLM: %s", e, exc_info=True)
             # Return empty dict on error - UI will fall back to schema descriptions
             return {}
 
@@ -1240,5 +1257,5 @@ class ChatService:
         Returns:
             Formatted SSE event string
         """
-        data_json = json.dumps(data)
+        data_json = orjson.dumps(data).decode()
         return f"event: {event_type}\ndata: {data_json}\n\n"
@@ -9,6 +9,9 @@ from common.services.file_storage import FileStorage
 
 logger = logging.getLogger(__name__)
 
+# Image MIME types accepted by the Responses API as input_image
+_IMAGE_CONTENT_TYPES: frozenset[str] = frozenset({"image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"})
+
 
 class FileProcessor:
     """Process files for LLM integration."""
@@ -43,11 +46,10 @@ class FileProcessor:
 
             # Determine file type and process accordingly
             content_type = file_metadata.content_type.lower()
-            filename = file_metadata.filename.lower()
 
             if FileProcessor._is_image(content_type):
                 return FileProcessor._process_image(file_content, content_type)
-            elif FileProcessor._is_pdf(content_type, filename):
+            elif FileProcessor._is_pdf(content_type, file_metadata.filename):
                 return FileProcessor._process_pdf(file_content, content_type, file_metadata.filename)
             else:
                 logger.warning(
@@ -69,8 +71,7 @@ class FileProcessor:
         Returns:
             True if image, False otherwise
         """
-        image_types = ["image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"]
-        return content_type in image_types
+        return content_type in _IMAGE_CONTENT_TYPES
 
     @staticmethod
     def _is_pdf(content_type: str, filename: str) -> bool:
@@ -83,7 +84,8 @@ class FileProcessor:
         Returns:
             True if PDF, False otherwise
         """
-        return content_type == "application/pdf" or filename.endswith(".pdf")
+        # Only the extension is lowercased, not the whole filename
+        return content_type == "application/pdf" or filename[-4:].lower() == ".pdf"
 
     @staticmethod
     def _process_image(content: bytes, content_type: str) -> dict[str, Any]:
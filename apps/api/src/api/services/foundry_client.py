@@ -1,11 +1,14 @@
 """Azure AI Foundry client service."""
 
 import logging
+from typing import TYPE_CHECKING
 
 from api.config import Settings
-from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential
-from openai import OpenAI
+
+if TYPE_CHECKING:
+    from azure.ai.projects import AIProjectClient
+    from azure.core.credentials import TokenCredential
+    from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -13,17 +16,19 @@ logger = logging.getLogger(__name__)
 class FoundryClient:
     """Client for Azure AI Foundry integration."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, credential: "TokenCredential | None" = None) -> None:
         """Initialize Foundry client.
 
         Args:
             settings: Application settings
+            credential: Shared token credential (DefaultAzureCredential is created if not given)
         """
         self.settings = settings
+        self._credential = credential
         self._client: OpenAI | None = None
         self._project_client: AIProjectClient | None = None
 
-    def _get_project_client(self) -> AIProjectClient:
+    def _get_project_client(self) -> "AIProjectClient":
         """Get or create AI Project client.
 
         Returns:
@@ -33,14 +38,18 @@ class FoundryClient:
             if not self.settings.foundry_endpoint:
                 raise ValueError("FOUNDRY_ENDPOINT is not set")
 
+            # Deferred so the Azure AI SDK is only loaded when Foundry is actually used
+            from azure.ai.projects import AIProjectClient
+            from azure.identity import DefaultAzureCredential
+
             try:
-                credential = DefaultAzureCredential()
-                logger.info(f"Initializing AI Project client with endpoint: {self.settings.foundry_endpoint}")
+                credential = self._credential or DefaultAzureCredential()
+                logger.info("Initializing AI Project client with endpoint: %s", self.settings.foundry_endpoint)
                 self._project_client = AIProjectClient(endpoint=self.settings.foundry_endpoint, credential=credential)
                 logger.info("AI Project client initialized with managed identity")
             except Exception as e:
-                logger.error(f"Failed to initialize AI Project client: {e}")
-                logger.error(f"Endpoint: {self.settings.foundry_endpoint}")
+                logger.error("Failed to initialize AI Project client: %s", e)
+                logger.error("Endpoint: %s", self.settings.foundry_endpoint)
                 logger.error(
                     "Ensure the managed identity has 'Cognitive Services User' role (not 'Cognitive Services OpenAI User')"
                 )
@@ -48,19 +57,42 @@ class FoundryClient:
 
         return self._project_client
 
-    def get_openai_client(self) -> OpenAI:
+    def get_openai_client(self) -> "OpenAI":
         """Get authenticated OpenAI client from Foundry project.
 
         Returns:
             OpenAI client instance
         """
         if self._client is None:
+            # The OpenAI SDK is typed against httpx2, so the limits must come from it too
+            import httpx2
+            from openai import DefaultHttpxClient
+
             project_client = self._get_project_client()
-            self._client = project_client.get_openai_client()
+            # Concurrent streams multiplex over a few kept-alive HTTP/2 connections
+            # instead of paying a TLS handshake per request
+            http_client = DefaultHttpxClient(
+                http2=True,
+                limits=httpx2.Limits(
+                    max_connections=self.settings.foundry_max_connections,
+                    max_keepalive_connections=self.settings.foundry_max_keepalive_connections,
+                    keepalive_expiry=self.settings.foundry_keepalive_expiry,
+                ),
+            )
+            self._client = project_client.get_openai_client(http_client=http_client)
             logger.info("OpenAI client initialized from Foundry project")
 
         return self._client
 
+    def close(self) -> None:
+        """Close the underlying OpenAI and AI Project clients, releasing pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._project_client is not None:
+            self._project_client.close()
+            self._project_client = None
+
     def is_configured(self) -> bool:
         """Check if Foundry is properly configured.
 
@@ -1,10 +1,10 @@
 """Tool registry for MCP/tool calls."""
 
-import json
 import logging
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from common.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
@@ -137,13 +137,13 @@ class ToolRegistry:
             raise ValueError(f"Tool {tool_name} not found")
 
         try:
-            arguments = json.loads(arguments_json) if arguments_json else {}
-        except json.JSONDecodeError:
+            arguments = orjson.loads(arguments_json) if arguments_json else {}
+        except orjson.JSONDecodeError:
             arguments = {}
 
         tool_func = self.tools[tool_name]
         result = await tool_func(**arguments)
-        logger.info(f"Executed tool {tool_name} with result: {result}")
+        logger.info("Executed tool %s with result: %s", tool_name, result)
         return result
 
     async def _search_users(self, name: str) -> dict[str, Any]:
@@ -2,9 +2,14 @@
 
 import os
 import sys
+from collections.abc import Iterator
+from typing import BinaryIO
 
 import pytest
 from api.main import app
+from api.services import get_chat_store, get_file_storage, get_user_service
+from common.models.chat import FileUploadResponse
+from common.models.user import User
 from fastapi.testclient import TestClient
 
 # Ensure 'apps/api/src' is on sys.path for absolute 'api.*' imports
@@ -14,6 +19,83 @@ if _SRC_PATH not in sys.path:
     sys.path.insert(0, _SRC_PATH)
 
 
+class FakeFileStorage:
+    """In-memory stand-in for BlobFileStorage."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+
+    def upload_file(self, file_id: str, content: bytes | BinaryIO, metadata: FileUploadResponse) -> str:
+        self.files[file_id] = content if isinstance(content, bytes) else content.read()
+        return file_id
+
+    def download_file(self, file_id: str) -> bytes:
+        if file_id not in self.files:
+            raise FileNotFoundError(file_id)
+        return self.files[file_id]
+
+
+class FakeChatStore:
+    """In-memory stand-in for CosmosChatStore that records run control calls."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, FileUploadResponse] = {}
+        self.hashes: dict[str, str] = {}
+        self.cancelled: list[str] = []
+        self.decisions: list[tuple[str, str, bool, str | None]] = []
+
+    def store_file(self, file_id: str, file_data: FileUploadResponse, *, content_hash: str | None = None) -> None:
+        self.files[file_id] = file_data
+        if content_hash:
+            self.hashes[content_hash] = file_id
+
+    def get_file(self, file_id: str) -> FileUploadResponse | None:
+        return self.files.get(file_id)
+
+    def find_file_by_hash(
+        self, content_hash: str, user_id: str = "default", tenant_id: str | None = None
+    ) -> FileUploadResponse | None:
+        file_id = self.hashes.get(content_hash)
+        return self.files[file_id] if file_id else None
+
+    def cancel_run(self, run_id: str) -> None:
+        self.cancelled.append(run_id)
+
+    def approve_tool_call(
+        self, run_id: str, tool_call_id: str, approved: bool, partition_key: str | None = None
+    ) -> None:
+        self.decisions.append((run_id, tool_call_id, approved, partition_key))
+
+
+class FakeUserService:
+    """In-memory stand-in for CosmosUserService."""
+
+    def __init__(self) -> None:
+        self.users: dict[str, User] = {}
+
+    def add_user(self, user: User) -> bool:
+        self.users[user.user_id] = user
+        return True
+
+    def list_users(self) -> list[User]:
+        return list(self.users.values())
+
+
+@pytest.fixture
+def file_storage() -> FakeFileStorage:
+    return FakeFileStorage()
+
+
+@pytest.fixture
+def chat_store() -> FakeChatStore:
+    return FakeChatStore()
+
+
+@pytest.fixture
+def user_service() -> FakeUserService:
+    return FakeUserService()
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create a FastAPI test client."""
@@ -24,3 +106,21 @@ def client() -> TestClient:
 def api_url() -> str:
     """Get the API base URL."""
     return "http://localhost:8000/api"
+
+
+@pytest.fixture
+def services_client(
+    client: TestClient, chat_store: FakeChatStore, file_storage: FakeFileStorage, user_service: FakeUserService
+) -> Iterator[TestClient]:
+    """Test client with the backend service dependencies replaced by in-memory fakes."""
+    overrides = {
+        get_chat_store: lambda: chat_store,
+        get_file_storage: lambda: file_storage,
+        get_user_service: lambda: user_service,
+    }
+    app.dependency_overrides.update(overrides)
+    try:
+        yield client
+    finally:
+        for dependency in overrides:
+            app.dependency_overrides.pop(dependency, None)
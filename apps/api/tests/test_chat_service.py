@@ -0,0 +1,40 @@
+"""Tests for the chat service helpers."""
+
+import pytest
+from api.config import Settings
+from api.services.chat_service import ChatService
+from api.services.foundry_client import FoundryClient
+from common.models.chat import FileUploadResponse
+
+from tests.conftest import FakeChatStore, FakeFileStorage
+
+
+@pytest.mark.unit
+async def test_load_file_content_items_keeps_order_and_skips_missing_files(
+    chat_store: FakeChatStore, file_storage: FakeFileStorage
+) -> None:
+    """Test attached files are loaded in request order and unknown files are dropped."""
+    chat_store.files = {
+        "a.png": FileUploadResponse(file_id="a.png", filename="a.png", content_type="image/png", size=3),
+        "b.pdf": FileUploadResponse(file_id="b.pdf", filename="B.PDF", content_type="", size=3),
+    }
+    file_storage.files = {"a.png": b"png", "b.pdf": b"pdf"}
+    settings = Settings()
+    service = ChatService(FoundryClient(settings), settings, chat_store, file_storage)
+
+    items = await service._load_file_content_items(["b.pdf", "missing", "a.png"])
+
+    assert [item["type"] for item in items] == ["input_file", "input_image"]
+    assert items[0]["filename"] == "B.PDF"
+    assert items[1]["image_url"].startswith("data:image/png;base64,")
+
+
+@pytest.mark.unit
+def test_format_sse_event_encodes_compact_utf8_json(chat_store: FakeChatStore, file_storage: FakeFileStorage) -> None:
+    """Test SSE events carry the event type and a compact JSON data line."""
+    settings = Settings()
+    service = ChatService(FoundryClient(settings), settings, chat_store, file_storage)
+
+    event = service._format_sse_event("delta", {"runId": "resp_000001", "content": "héllo"})
+
+    assert event == 'event: delta\ndata: {"runId":"resp_000001","content":"héllo"}\n\n'
@@ -0,0 +1,75 @@
+"""Tests for SSE event coalescing in the chat routes."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from api.routes.chat import SSEResponse, _coalesce_events
+
+
+async def _events(*events: str) -> AsyncIterator[str]:
+    for event in events:
+        yield event
+
+
+@pytest.mark.unit
+async def test_coalesce_events_merges_queued_events_in_order() -> None:
+    events = [f"data: {i}\n\n" for i in range(10)]
+    source_done = asyncio.Event()
+
+    async def source() -> AsyncIterator[str]:
+        for event in events:
+            yield event
+        source_done.set()
+
+    stream = _coalesce_events(source())
+
+    # The first read starts the producer, which queues every event before the reader wakes up
+    first = await anext(stream)
+
+    assert source_done.is_set()
+    assert first == "".join(events)
+    assert [chunk async for chunk in stream] == []
+
+
+@pytest.mark.unit
+async def test_coalesce_events_propagates_source_errors() -> None:
+    async def failing() -> AsyncIterator[str]:
+        yield "data: first\n\n"
+        raise RuntimeError("upstream failed")
+
+    received: list[str] = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for chunk in _coalesce_events(failing()):
+            received.append(chunk)
+
+    assert received == ["data: first\n\n"]
+
+
+@pytest.mark.unit
+async def test_coalesce_events_closes_source_when_client_goes_away() -> None:
+    closed = asyncio.Event()
+
+    async def endless() -> AsyncIterator[str]:
+        try:
+            while True:
+                yield "data: tick\n\n"
+        finally:
+            closed.set()
+
+    stream = _coalesce_events(endless())
+    await anext(stream)
+    await stream.aclose()
+
+    assert closed.is_set()
+
+
+@pytest.mark.unit
+def test_sse_response_uses_prebuilt_headers() -> None:
+    response = SSEResponse(_events("data: x\n\n"))
+    other = SSEResponse(_events())
+
+    assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
+    assert response.raw_headers is not other.raw_headers
@@ -0,0 +1,52 @@
+"""Tests for application settings."""
+
+import pytest
+from api.config import ConfigError, Settings, get_settings
+from pydantic import ValidationError
+
+
+@pytest.mark.unit
+def test_get_settings_is_cached() -> None:
+    """Test get_settings returns the same instance on repeated calls."""
+    assert get_settings() is get_settings()
+
+
+@pytest.mark.unit
+def test_get_settings_cache_clear_reloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test clearing the cache re-reads the environment."""
+    original = get_settings()
+    monkeypatch.setenv("APP_NAME", "reloaded-app")
+    get_settings.cache_clear()
+    try:
+        reloaded = get_settings()
+        assert reloaded is not original
+        assert isinstance(reloaded, Settings)
+        assert reloaded.app_name == "reloaded-app"
+    finally:
+        monkeypatch.delenv("APP_NAME")
+        get_settings.cache_clear()
+
+
+@pytest.mark.unit
+def test_settings_are_immutable() -> None:
+    """Test settings cannot be mutated after construction."""
+    settings = get_settings()
+    with pytest.raises(ValidationError):
+        settings.environment = "production"  # type: ignore[misc]
+
+
+@pytest.mark.unit
+def test_validate_runtime_lists_all_missing_settings() -> None:
+    """Test every missing required setting is reported in a single error."""
+    settings = Settings(azure_cosmosdb_endpoint=None, azure_storage_account_name=None)
+    with pytest.raises(ConfigError, match="AZURE_COSMOSDB_ENDPOINT, AZURE_STORAGE_ACCOUNT_NAME"):
+        settings.validate_runtime()
+
+
+@pytest.mark.unit
+def test_validate_runtime_accepts_complete_settings() -> None:
+    """Test validation passes when all required settings are present."""
+    settings = Settings(
+        azure_cosmosdb_endpoint="https://example.documents.azure.com/", azure_storage_account_name="acct"
+    )
+    settings.validate_runtime()
@@ -0,0 +1,30 @@
+"""Tests for the application error handlers."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_validation_error_returns_422_with_cors_headers(services_client: TestClient) -> None:
+    """Test validation errors are reported with CORS headers for allowed origins."""
+    response = services_client.post(
+        "/api/users",
+        json={"user_id": "user-1"},
+        headers={"origin": "http://localhost:5173"},
+    )
+
+    assert response.status_code == 422
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    missing = {tuple(error["loc"]) for error in response.json()["detail"]}
+    assert ("body", "name") in missing
+    assert ("body", "email") in missing
+
+
+@pytest.mark.unit
+def test_http_exception_returns_json_detail(client: TestClient) -> None:
+    """Test HTTP errors keep FastAPI's {"detail": ...} body."""
+    response = client.get("/v1/does-not-exist")
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": "Not Found"}
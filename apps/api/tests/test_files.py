@@ -0,0 +1,73 @@
+"""Tests for the file upload endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import FakeChatStore, FakeFileStorage
+
+
+@pytest.mark.unit
+def test_upload_file_streams_content_to_storage(
+    services_client: TestClient, file_storage: FakeFileStorage, chat_store: FakeChatStore
+) -> None:
+    """Test an uploaded file is stored with its size and metadata."""
+    content = b"%PDF-1.7 test content"
+    response = services_client.post("/v1/files", files={"file": ("Report.PDF", content, "application/pdf")})
+
+    assert response.status_code == 200
+    data = response.json()
+    file_id = data["fileId"]
+    assert file_id.endswith(".pdf")
+    assert data["fileName"] == "Report.PDF"
+    assert data["contentType"] == "application/pdf"
+    assert data["size"] == len(content)
+    assert file_storage.files[file_id] == content
+    assert chat_store.files[file_id].size == len(content)
+
+
+@pytest.mark.unit
+def test_upload_files_batch_uploads_all_files(
+    services_client: TestClient, file_storage: FakeFileStorage, chat_store: FakeChatStore
+) -> None:
+    """Test the batch endpoint uploads every file and preserves order."""
+    uploads = [("files", (f"note-{i}.txt", f"content {i}".encode(), "text/plain")) for i in range(5)]
+    response = services_client.post("/v1/files/batch", files=uploads)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["fileName"] for item in data] == [f"note-{i}.txt" for i in range(5)]
+    for i, item in enumerate(data):
+        assert file_storage.files[item["fileId"]] == f"content {i}".encode()
+        assert item["fileId"] in chat_store.files
+
+
+@pytest.mark.unit
+def test_upload_file_reuses_file_with_identical_content(
+    services_client: TestClient, file_storage: FakeFileStorage, chat_store: FakeChatStore
+) -> None:
+    """Test re-uploading the same content returns the stored file, matching what get_file reports for it."""
+    content = b"same bytes"
+    first = services_client.post("/v1/files", files={"file": ("a.txt", content, "text/plain")})
+    second = services_client.post("/v1/files", files={"file": ("b.md", content, "text/markdown")})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    data = second.json()
+    assert data["fileId"] == first.json()["fileId"]
+    stored = chat_store.get_file(data["fileId"])
+    assert stored is not None
+    assert data == stored.model_dump(by_alias=True)
+    assert stored.filename == "a.txt"
+    assert len(file_storage.files) == 1
+    assert len(chat_store.files) == 1
+
+
+@pytest.mark.unit
+def test_upload_file_infers_content_type_from_extension(services_client: TestClient) -> None:
+    """Test a missing content type is derived from the filename extension."""
+    response = services_client.post("/v1/files", files={"file": ("Scan.JPEG", b"\xff\xd8\xff", "")})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["contentType"] == "image/jpeg"
+    assert data["fileId"].endswith(".jpeg")
@@ -0,0 +1,36 @@
+"""Tests for the Foundry client."""
+
+from typing import Any
+
+import httpx2
+import openai
+import pytest
+from api.config import Settings
+from api.services.foundry_client import FoundryClient
+
+
+class FakeProjectClient:
+    """Project client that hands back the HTTP client it was given."""
+
+    def get_openai_client(self, http_client: Any) -> Any:
+        return http_client
+
+
+@pytest.mark.unit
+def test_openai_client_uses_http2_with_configured_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the OpenAI client is built on an HTTP/2 client with the configured connection limits."""
+    created: dict[str, Any] = {}
+
+    def fake_http_client(**kwargs: Any) -> dict[str, Any]:
+        created.update(kwargs)
+        return kwargs
+
+    monkeypatch.setattr(openai, "DefaultHttpxClient", fake_http_client)
+    settings = Settings(foundry_max_connections=7, foundry_max_keepalive_connections=3, foundry_keepalive_expiry=12.0)
+    client = FoundryClient(settings)
+    monkeypatch.setattr(client, "_get_project_client", FakeProjectClient)
+
+    client.get_openai_client()
+
+    assert created["http2"] is True
+    assert created["limits"] == httpx2.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.0)
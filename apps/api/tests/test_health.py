@@ -1,17 +1,34 @@
 """Tests for the health check endpoint."""
 
+from collections.abc import Iterator
+from types import SimpleNamespace
+
 import pytest
+from api.config import ConfigError, get_settings
+from api.main import app
+from api.services.foundry_client import FoundryClient
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture
+def published_services() -> Iterator[None]:
+    """Publish the services the lifespan would build; health only reads the Foundry client."""
+    app.state.services = SimpleNamespace(foundry_client=FoundryClient(get_settings()))
+    try:
+        yield
+    finally:
+        del app.state.services
+
+
 @pytest.mark.unit
 def test_health_check(client: TestClient) -> None:
-    """Test the health check endpoint returns 200."""
+    """Test the health check endpoint returns 200 even when no services are published."""
     response = client.get("/api/health")
     assert response.status_code == 200
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("published_services")
 def test_health_check_response_schema(client: TestClient) -> None:
     """Test the health check endpoint response has correct schema."""
     response = client.get("/api/health")
@@ -40,3 +57,36 @@ def test_health_check_response_json() -> None:
     # Should not raise
     response_dict = response.model_dump()
     assert response_dict["status"] == "ok"
+
+
+@pytest.mark.unit
+def test_health_check_reports_degraded_when_services_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test health still answers 200 with a degraded body when service initialization fails."""
+    monkeypatch.setenv("AZURE_COSMOSDB_ENDPOINT", "")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    get_settings.cache_clear()
+    try:
+        with TestClient(app) as client:
+            response = client.get("/api/health")
+            services_response = client.post("/v1/runs/resp_000001/stop")
+    finally:
+        get_settings.cache_clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["foundry_configured"] is False
+    assert services_response.status_code == 503
+
+
+@pytest.mark.unit
+def test_startup_fails_when_services_fail_outside_development(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test any non-development environment refuses to start without its services."""
+    monkeypatch.setenv("AZURE_COSMOSDB_ENDPOINT", "")
+    monkeypatch.setenv("ENVIRONMENT", "staging")
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(ConfigError), TestClient(app):
+            pass
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,94 @@
+"""Tests for middleware setup and CORS helpers."""
+
+import pytest
+from api.middleware import get_allowed_origins, get_cors_headers, setup_middleware
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_get_allowed_origins_adds_scheme_variant() -> None:
+    """Test the UI URL is allowed over both http and https."""
+    origins = get_allowed_origins("https://ui.example.com/", "production")
+    assert origins == ("https://ui.example.com", "http://ui.example.com")
+
+
+@pytest.mark.unit
+def test_get_allowed_origins_includes_dev_origins() -> None:
+    """Test local Vite origins are allowed in development."""
+    origins = get_allowed_origins(None, "Development")
+    assert "http://localhost:5173" in origins
+    assert "http://127.0.0.1:3000" in origins
+
+
+@pytest.mark.unit
+def test_get_cors_headers_allowed_origin() -> None:
+    """Test CORS headers echo an allowed origin."""
+    headers = get_cors_headers("https://ui.example.com", ui_url="https://ui.example.com", environment="production")
+    assert headers["Access-Control-Allow-Origin"] == "https://ui.example.com"
+    assert headers["Access-Control-Allow-Credentials"] == "true"
+
+
+@pytest.mark.unit
+def test_get_cors_headers_rejected_origin() -> None:
+    """Test CORS headers are empty for unknown or missing origins."""
+    assert get_cors_headers("https://evil.example.com", ui_url="https://ui.example.com", environment="production") == {}
+    assert get_cors_headers(None, ui_url="https://ui.example.com", environment="production") == {}
+
+
+@pytest.mark.unit
+def test_request_size_limit_rejects_large_content_length() -> None:
+    """Test bodies larger than the limit are rejected with 413 and CORS headers."""
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        return {"size": len(await request.body())}
+
+    setup_middleware(app, ui_url="https://ui.example.com", environment="production", max_body_bytes=10)
+    client = TestClient(app)
+
+    assert client.post("/echo", content=b"0123456789").json() == {"size": 10}
+    response = client.post("/echo", content=b"0123456789A", headers={"origin": "https://ui.example.com"})
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "https://ui.example.com"
+
+
+@pytest.mark.unit
+def test_request_size_limit_rejects_large_chunked_body() -> None:
+    """Test bodies streamed without a Content-Length are cut off with 413 once they pass the limit."""
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        return {"size": len(await request.body())}
+
+    setup_middleware(app, max_body_bytes=10)
+    client = TestClient(app)
+
+    response = client.post("/echo", content=iter([b"01234", b"56789", b"A"]))
+    assert "content-length" not in response.request.headers
+    assert response.status_code == 413
+    assert client.post("/echo", content=iter([b"01234", b"56789"])).json() == {"size": 10}
+
+
+@pytest.mark.unit
+def test_gzip_compresses_large_json_but_not_event_streams() -> None:
+    """Test large JSON responses are gzipped while SSE streams are left uncompressed."""
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> dict[str, str]:
+        return {"data": "x" * 4096}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(iter(["data: " + "x" * 4096 + "\n\n"]), media_type="text/event-stream")
+
+    setup_middleware(app, gzip_minimum_size=2048)
+    client = TestClient(app)
+
+    headers = {"accept-encoding": "gzip"}
+    assert client.get("/large", headers=headers).headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in client.get("/stream", headers=headers).headers
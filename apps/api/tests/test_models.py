@@ -0,0 +1,31 @@
+"""Tests for the shared chat request models."""
+
+import pytest
+from common.models.chat import ChatMessage, ChatRequest
+from pydantic import ValidationError
+
+
+@pytest.mark.unit
+def test_chat_request_accepts_camel_case_and_ignores_unknown_fields() -> None:
+    """Test chat requests parse the UI payload and drop unknown fields."""
+    request = ChatRequest.model_validate(
+        {"threadId": "conv_1", "messages": [{"role": "user", "content": "hi", "id": "x"}], "extra": True}
+    )
+
+    assert request.thread_id == "conv_1"
+    assert request.messages == [ChatMessage(role="user", content="hi")]
+
+
+@pytest.mark.unit
+def test_chat_request_requires_a_message() -> None:
+    """Test an empty message list fails validation."""
+    with pytest.raises(ValidationError):
+        ChatRequest(messages=[])
+
+
+@pytest.mark.unit
+def test_chat_message_is_immutable() -> None:
+    """Test messages cannot be modified after validation."""
+    message = ChatMessage(role="user", content="hi")
+    with pytest.raises(ValidationError):
+        message.content = "changed"
@@ -0,0 +1,29 @@
+"""Tests for the run control endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import FakeChatStore
+
+
+@pytest.mark.unit
+def test_stop_run_cancels_run(services_client: TestClient, chat_store: FakeChatStore) -> None:
+    """Test stopping a run marks it cancelled in the store."""
+    response = services_client.post("/v1/runs/resp_000001/stop")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "cancelled", "runId": "resp_000001"}
+    assert chat_store.cancelled == ["resp_000001"]
+
+
+@pytest.mark.unit
+def test_approve_tool_call_records_decision(services_client: TestClient, chat_store: FakeChatStore) -> None:
+    """Test a tool call decision is passed to the store with its partition key."""
+    response = services_client.post(
+        "/v1/runs/resp_000001/toolcalls/call_1",
+        json={"approved": False, "partitionKey": "t1|default|conv_1"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "rejected"
+    assert chat_store.decisions == [("resp_000001", "call_1", False, "t1|default|conv_1")]
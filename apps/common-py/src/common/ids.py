@@ -0,0 +1,18 @@
+"""Compact, time-ordered identifiers."""
+
+import os
+import time
+
+
+def new_id() -> str:
+    """Generate a unique, time-ordered identifier.
+
+    The ID packs a 48-bit millisecond timestamp and 80 random bits into 128 bits
+    (the ULID layout) and formats them as 32 lowercase hex characters, so IDs
+    sort by creation time.
+
+    Returns:
+        32-character identifier
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    return f"{value:032x}"
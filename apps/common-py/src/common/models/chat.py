@@ -14,7 +14,7 @@ class FileUploadResponse(BaseModel):
     content_type: str = Field(..., alias="contentType", description="MIME type of the file")
     size: int = Field(..., description="File size in bytes")
 
-    model_config = ConfigDict(populate_by_name=True)  # Allow both camelCase and snake_case
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")  # Allow both camelCase and snake_case
 
 
 class ChatMessage(BaseModel):
@@ -27,15 +27,17 @@ class ChatMessage(BaseModel):
         None, description="Full content array including function calls and outputs"
     )
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class ChatRequest(BaseModel):
     """Request model for chat stream."""
 
     thread_id: str | None = Field(None, alias="threadId", description="Optional thread ID for conversation continuity")
-    messages: list[ChatMessage] = Field(..., description="List of chat messages")
+    messages: list[ChatMessage] = Field(..., min_length=1, description="List of chat messages")
     file_ids: list[str] = Field(default_factory=list, alias="fileIds", description="Attached file IDs for this request")
 
-    model_config = ConfigDict(populate_by_name=True)  # Allow both threadId and thread_id
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")  # Allow both threadId and thread_id
 
 
 class ToolCall(BaseModel):
@@ -54,7 +56,8 @@ class ToolApprovalRequest(BaseModel):
         None, alias="partitionKey", description="Partition key for the function call document"
     )
 
-    model_config = ConfigDict(populate_by_name=True)  # Allow both partitionKey and partition_key
+    # Allow both partitionKey and partition_key
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
 
 
 class ParameterRequest(BaseModel):
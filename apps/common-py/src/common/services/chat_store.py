@@ -6,10 +6,12 @@ from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import Any
 
+from azure.core.credentials import TokenCredential
 from azure.cosmos import CosmosClient
 from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 
+from common.ids import new_id
 from common.models.chat import (
     ChatMessage,
     FileUploadResponse,
@@ -18,6 +20,9 @@ from common.models.chat import (
 
 logger = logging.getLogger(__name__)
 
+# Conversation segment of the partition key holding a user's file hash index documents
+_FILE_HASH_PARTITION = "fileHashes"
+
 
 class ChatStore(ABC):
     """Abstract interface for chat store."""
@@ -30,6 +35,14 @@ class ChatStore(ABC):
             Tuple of (run_id, conversation_id)
         """
 
+    @abstractmethod
+    def start_run(self, thread_id: str | None, messages: list[ChatMessage]) -> tuple[str, str]:
+        """Create a new run with its initial messages in a single write.
+
+        Returns:
+            Tuple of (run_id, conversation_id)
+        """
+
     @abstractmethod
     def add_message(self, run_id: str, message: ChatMessage, conversation_id: str | None = None) -> None:
         """Add a message to a response.
@@ -42,6 +55,16 @@ class ChatStore(ABC):
         Note: Messages are now embedded in response.input array instead of creating separate documents.
         """
 
+    @abstractmethod
+    def add_messages(self, run_id: str, messages: list[ChatMessage], conversation_id: str | None = None) -> None:
+        """Add several messages to a response in a single write.
+
+        Args:
+            run_id: Response ID (kept as run_id for backward compatibility)
+            messages: Messages to add, in order
+            conversation_id: Optional conversation ID to filter by (prevents duplicates if run_id exists in multiple conversations)
+        """
+
     @abstractmethod
     def get_messages(self, run_id: str, conversation_id: str | None = None) -> list[ChatMessage]:
         """Get all messages for a conversation, reconstructed from responses.
@@ -171,13 +194,19 @@ class ChatStore(ABC):
         """Mark a run as error."""
 
     @abstractmethod
-    def store_file(self, file_id: str, file_data: FileUploadResponse) -> None:
-        """Store file metadata."""
+    def store_file(self, file_id: str, file_data: FileUploadResponse, *, content_hash: str | None = None) -> None:
+        """Store file metadata, indexed by content hash when one is given."""
 
     @abstractmethod
     def get_file(self, file_id: str) -> FileUploadResponse | None:
         """Get file metadata."""
 
+    @abstractmethod
+    def find_file_by_hash(
+        self, content_hash: str, user_id: str = "default", tenant_id: str | None = None
+    ) -> FileUploadResponse | None:
+        """Find a file previously uploaded by the same user with the same content hash."""
+
     @abstractmethod
     def get_responses(
         self,
@@ -271,12 +300,14 @@ class CosmosChatStore(ChatStore):
 
     def __init__(
         self,
-        cosmos_endpoint: str,
+        cosmos_endpoint: str | None = None,
         cosmos_key: str | None = None,
         database_name: str = "agenticdb",
         agent_store_container_name: str = "agentStore",
         default_tenant_id: str = "t1",
         use_managed_identity: bool = False,
+        client: CosmosClient | None = None,
+        credential: TokenCredential | None = None,
         # Legacy parameters for backward compatibility
         runs_container_name: str | None = None,
         files_container_name: str | None = None,
@@ -284,18 +315,24 @@ class CosmosChatStore(ChatStore):
         """Initialize Cosmos DB chat store.
 
         Args:
-            cosmos_endpoint: Cosmos DB endpoint URL
+            cosmos_endpoint: Cosmos DB endpoint URL (required unless client is given)
             cosmos_key: Cosmos DB key (if not using managed identity)
             database_name: Database name (default: agenticdb)
             agent_store_container_name: Container name for agentStore (default: agentStore)
             default_tenant_id: Default tenant ID to use (default: t1)
             use_managed_identity: Use managed identity for authentication
+            client: Existing Cosmos client to share instead of creating one
+            credential: Shared token credential for managed identity (created if not given)
             runs_container_name: Legacy parameter (ignored)
             files_container_name: Legacy parameter (ignored)
         """
 
-        if use_managed_identity:
-            credential = DefaultAzureCredential()
+        if client is not None:
+            self.client = client
+        elif not cosmos_endpoint:
+            raise ValueError("cosmos_endpoint is required when no client is given")
+        elif use_managed_identity:
+            credential = credential or DefaultAzureCredential()
             self.client = CosmosClient(cosmos_endpoint, credential)
         else:
             if not cosmos_key:
@@ -314,6 +351,10 @@ class CosmosChatStore(ChatStore):
         """Build partition key in format: tenantId|userId|conversationId."""
         return f"{tenant_id}|{user_id}|{conversation_id}"
 
+    def _file_hash_id(self, content_hash: str) -> str:
+        """Generate the ID of a file hash index document: hash_<sha256>."""
+        return f"hash_{content_hash}"
+
     def _generate_message_id(self, seq: int) -> str:
         """Generate message ID with zero-padded format: msg_000012."""
         return f"msg_{seq:06d}"
@@ -322,6 +363,17 @@ class CosmosChatStore(ChatStore):
         """Generate response ID with zero-padded format: resp_000004."""
         return f"resp_{seq:06d}"
 
+    def _to_input_message(self, message: ChatMessage) -> dict[str, Any]:
+        """Convert a chat message to an entry of a response's input array."""
+        input_message: dict[str, Any] = {
+            "role": message.role,
+            "content": message.content,
+        }
+        # Add file_ids if present
+        if message.file_ids:
+            input_message["file_ids"] = message.file_ids
+        return input_message
+
     def _determine_conversation_id(self, thread_id: str | None) -> str:
         """Determine conversation_id from thread_id.
 
@@ -331,8 +383,6 @@ class CosmosChatStore(ChatStore):
         Returns:
             Conversation ID (always starts with "conv_")
         """
-        import uuid
-
         if thread_id:
             # Ensure conversation_id starts with "conv_"
             if not thread_id.startswith("conv_"):
@@ -340,7 +390,7 @@ class CosmosChatStore(ChatStore):
             else:
                 return thread_id
         else:
-            return f"conv_{uuid.uuid4().hex[:16]}"
+            return f"conv_{new_id()}"
 
     def _get_conversation_doc(self, tenant_id: str, user_id: str, conversation_id: str) -> dict[str, Any] | None:
         """Get conversation document by ID."""
@@ -625,6 +675,29 @@ class CosmosChatStore(ChatStore):
             user_id: User ID (default: "default")
             tenant_id: Tenant ID (default: from settings)
 
+        Returns:
+            Tuple of (run_id, conversation_id)
+        """
+        return self.start_run(thread_id, [], user_id=user_id, tenant_id=tenant_id)
+
+    def start_run(
+        self,
+        thread_id: str | None,
+        messages: list[ChatMessage],
+        user_id: str = "default",
+        tenant_id: str | None = None,
+    ) -> tuple[str, str]:
+        """Create a new run with its initial messages in a single write.
+
+        The messages are embedded in the new response document's input array,
+        which saves the read and replace that add_messages would need.
+
+        Args:
+            thread_id: Thread/conversation ID (used as conversation_id)
+            messages: Initial input messages, in order
+            user_id: User ID (default: "default")
+            tenant_id: Tenant ID (default: from settings)
+
         Returns:
             Tuple of (run_id, conversation_id)
         """
@@ -654,7 +727,7 @@ class CosmosChatStore(ChatStore):
             "startedAt": now,
             "completedAt": None,
             "openaiResponseId": None,  # Will be set when OpenAI response is received
-            "input": [],  # Input messages array (populated as messages are added)
+            "input": [self._to_input_message(message) for message in messages],  # Input messages array
             "output": {"text": "", "metadata": {}},  # Output text and metadata
             "llm": None,
             "stepsSummary": None,
@@ -684,6 +757,28 @@ class CosmosChatStore(ChatStore):
 
         Note: Messages are now embedded in response.input array instead of creating separate documents.
         """
+        self.add_messages(run_id, [message], conversation_id=conversation_id, user_id=user_id, tenant_id=tenant_id)
+
+    def add_messages(
+        self,
+        run_id: str,
+        messages: list[ChatMessage],
+        conversation_id: str | None = None,
+        user_id: str = "default",
+        tenant_id: str | None = None,
+    ) -> None:
+        """Add several messages to a response with one read and one write.
+
+        Args:
+            run_id: Response ID (kept as run_id for backward compatibility)
+            messages: Messages to add, in order
+            conversation_id: Optional conversation ID to filter by (prevents duplicates if run_id exists in multiple conversations)
+            user_id: User ID (default: "default")
+            tenant_id: Tenant ID (default: from settings)
+        """
+        if not messages:
+            return
+
         tenant_id = tenant_id or self.default_tenant_id
 
         # If conversation_id is provided, use partition key for efficient query
@@ -722,17 +817,8 @@ class CosmosChatStore(ChatStore):
         if "input" not in response_doc:
             response_doc["input"] = []
 
-        # Create message object to append to input array
-        input_message = {
-            "role": message.role,
-            "content": message.content,
-        }
-        # Add file_ids if present
-        if message.file_ids:
-            input_message["file_ids"] = message.file_ids
-
-        # Append message to response.input array
-        response_doc["input"].append(input_message)
+        # Append messages to response.input array
+        response_doc["input"].extend(self._to_input_message(message) for message in messages)
 
         # Update response document
         # Remove _etag from body if present (it's metadata)
@@ -754,10 +840,10 @@ class CosmosChatStore(ChatStore):
                 )
             else:
                 self.agent_store_container.upsert_item(response_doc)
-            # logger.debug("Added message to response %s input array", run_id)
+            # logger.debug("Added %d messages to response %s input array", len(messages), run_id)
         except Exception as e:
             # If update fails, log and re-raise
-            logger.error("Failed to add message to response %s: %s", run_id, e)
+            logger.error("Failed to add messages to response %s: %s", run_id, e)
             raise
 
     def add_function_call(
@@ -1499,12 +1585,14 @@ class CosmosChatStore(ChatStore):
             tenant_id, user_id, conversation_id = partition_info
             pk = self._build_partition_key(tenant_id, user_id, conversation_id)
 
+        # One decision timestamp shared by the function_call and toolApproval documents
+        now = datetime.now(UTC).isoformat()
+
         # Update function_call document status
         function_call_id = f"fc_{tool_call_id}"
         try:
             function_call_doc = self.agent_store_container.read_item(item=function_call_id, partition_key=pk)
             if function_call_doc.get("type") == "function_call":
-                now = datetime.now(UTC).isoformat()
                 function_call_doc["status"] = "approved" if approved else "rejected"
                 if approved:
                     function_call_doc["approvedAt"] = now
@@ -1534,7 +1622,7 @@ class CosmosChatStore(ChatStore):
             approval_doc["status"] = "approved" if approved else "rejected"
             approval_doc["decision"] = {
                 "approved": approved,
-                "decidedAt": datetime.now(UTC).isoformat(),
+                "decidedAt": now,
             }
             self.agent_store_container.upsert_item(approval_doc)
         except CosmosResourceNotFoundError:
@@ -1893,6 +1981,8 @@ class CosmosChatStore(ChatStore):
         run_id: str | None = None,
         user_id: str = "default",
         tenant_id: str | None = None,
+        *,
+        content_hash: str | None = None,
     ) -> None:
         """Store file metadata as artifact document.
 
@@ -1903,15 +1993,15 @@ class CosmosChatStore(ChatStore):
             run_id: Run ID (optional)
             user_id: User ID (default: "default")
             tenant_id: Tenant ID (default: from settings)
+            content_hash: SHA-256 hex digest of the file content; when given, a hash
+                index document is written so find_file_by_hash can do a point read
         """
         tenant_id = tenant_id or self.default_tenant_id
 
         # If conversation_id not provided, we need to create a default one
         # or store without conversation context
         if not conversation_id:
-            import uuid
-
-            conversation_id = f"conv_{uuid.uuid4().hex[:16]}"
+            conversation_id = f"conv_{new_id()}"
 
         pk = self._build_partition_key(tenant_id, user_id, conversation_id)
         now = datetime.now(UTC).isoformat()
@@ -1936,11 +2026,25 @@ class CosmosChatStore(ChatStore):
                 "container": "agent-files",
                 "blobPath": f"{tenant_id}/{user_id}/{conversation_id}/{file_id}/{file_data.filename}",
             },
-            "hash": None,
         }
 
         try:
             self.agent_store_container.upsert_item(artifact_doc)
+            if content_hash:
+                self.agent_store_container.upsert_item(
+                    {
+                        "id": self._file_hash_id(content_hash),
+                        "pk": self._build_partition_key(tenant_id, user_id, _FILE_HASH_PARTITION),
+                        "type": "fileHash",
+                        "tenantId": tenant_id,
+                        "userId": user_id,
+                        "fileId": file_id,
+                        "name": file_data.filename,
+                        "mimeType": file_data.content_type,
+                        "sizeBytes": file_data.size,
+                        "createdAt": now,
+                    }
+                )
         except Exception as e:
             logger.error("Error storing file metadata: %s", e)
             raise
@@ -1982,6 +2086,35 @@ class CosmosChatStore(ChatStore):
             size=artifact_doc.get("sizeBytes", 0),
         )
 
+    def find_file_by_hash(
+        self, content_hash: str, user_id: str = "default", tenant_id: str | None = None
+    ) -> FileUploadResponse | None:
+        """Find a file previously uploaded by the same user with identical content.
+
+        Args:
+            content_hash: SHA-256 hex digest of the file content
+            user_id: User ID (default: "default")
+            tenant_id: Tenant ID (default: from settings)
+
+        Returns:
+            FileUploadResponse of the existing file or None if not found
+        """
+        tenant_id = tenant_id or self.default_tenant_id
+
+        # Point read of the hash index document written by store_file (no cross-partition query)
+        pk = self._build_partition_key(tenant_id, user_id, _FILE_HASH_PARTITION)
+        try:
+            hash_doc = self.agent_store_container.read_item(item=self._file_hash_id(content_hash), partition_key=pk)
+        except CosmosResourceNotFoundError:
+            return None
+
+        return FileUploadResponse(
+            file_id=hash_doc["fileId"],
+            filename=hash_doc["name"],
+            content_type=hash_doc.get("mimeType", ""),
+            size=hash_doc.get("sizeBytes", 0),
+        )
+
     # ========================================================================
     # Additional Query Methods
     # ========================================================================
@@ -3,8 +3,13 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
+from typing import BinaryIO
 
+import requests
+from azure.core.credentials import TokenCredential
 from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.pipeline.transport._requests_basic import BiggerBlockSizeHTTPAdapter
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import (
     BlobSasPermissions,
@@ -12,6 +17,7 @@ from azure.storage.blob import (
     ContentSettings,
     generate_blob_sas,
 )
+from urllib3.util.retry import Retry
 
 from common.models.chat import FileUploadResponse
 
@@ -22,8 +28,8 @@ class FileStorage(ABC):
     """Abstract interface for file storage."""
 
     @abstractmethod
-    def upload_file(self, file_id: str, content: bytes, metadata: FileUploadResponse) -> str:
-        """Upload a file."""
+    def upload_file(self, file_id: str, content: bytes | BinaryIO, metadata: FileUploadResponse) -> str:
+        """Upload a file from bytes or a readable binary stream."""
         pass
 
     @abstractmethod
@@ -52,6 +58,11 @@ class BlobFileStorage(FileStorage):
         container_name: str = "files",
         use_managed_identity: bool = False,
         blob_endpoint: str | None = None,
+        connection_pool_size: int = 32,
+        max_single_put_size: int = 4 * 1024 * 1024,
+        max_block_size: int = 4 * 1024 * 1024,
+        max_concurrency: int = 4,
+        credential: TokenCredential | None = None,
     ) -> None:
         """Initialize Blob Storage file service.
 
@@ -61,14 +72,45 @@ class BlobFileStorage(FileStorage):
             container_name: Container name for files
             use_managed_identity: Use managed identity for authentication
             blob_endpoint: Custom blob endpoint URL (for Azurite/local emulator)
+            connection_pool_size: Max keep-alive connections kept open to the storage account
+            max_single_put_size: Files up to this size are uploaded with a single PUT
+            max_block_size: Block size used when larger files are uploaded in blocks
+            max_concurrency: Blocks of a single file uploaded in parallel
+            credential: Shared token credential for managed identity (created if not given)
         """
         self.account_name = account_name
         self.container_name = container_name
+        self.max_concurrency = max_concurrency
+
+        # One pooled HTTP session shared by every blob call. The requests default of
+        # 10 connections is too small for concurrent uploads from worker threads and
+        # would drop connections, paying a new TLS handshake on the next request.
+        # A caller-provided session skips RequestsTransport's own setup, so mirror it:
+        # the larger socket block size adapter, urllib3 retries disabled in favour of
+        # the SDK retry policy, and proxy settings from the environment.
+        session = requests.Session()
+        session.trust_env = True
+        adapter = BiggerBlockSizeHTTPAdapter(
+            pool_maxsize=connection_pool_size,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        transport = RequestsTransport(session=session)
+        # Files above max_single_put_size are split into blocks that are staged in
+        # parallel and committed with a single block list.
+        client_options = {
+            "transport": transport,
+            "max_single_put_size": max_single_put_size,
+            "max_block_size": max_block_size,
+        }
 
         if use_managed_identity:
             account_url = f"https://{account_name}.blob.core.windows.net"
-            credential = DefaultAzureCredential()
-            self.blob_service_client = BlobServiceClient(account_url=account_url, credential=credential)
+            credential = credential or DefaultAzureCredential()
+            self.blob_service_client = BlobServiceClient(
+                account_url=account_url, credential=credential, **client_options
+            )
         else:
             if not account_key:
                 raise ValueError("account_key is required when not using managed identity")
@@ -101,7 +143,7 @@ class BlobFileStorage(FileStorage):
                     f"EndpointSuffix=core.windows.net"
                 )
             
-            self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+            self.blob_service_client = BlobServiceClient.from_connection_string(connection_string, **client_options)
 
         self.container_client = self.blob_service_client.get_container_client(container_name)
 
@@ -112,8 +154,17 @@ class BlobFileStorage(FileStorage):
             # Container already exists, ignore
             pass
 
-    def upload_file(self, file_id: str, content: bytes, metadata: FileUploadResponse) -> str:
-        """Upload a file with proper content type."""
+    def close(self) -> None:
+        """Close the Blob service client and its pooled connections."""
+        self.blob_service_client.close()
+
+    def upload_file(self, file_id: str, content: bytes | BinaryIO, metadata: FileUploadResponse) -> str:
+        """Upload a file with proper content type.
+
+        When ``content`` is a stream, the SDK reads and uploads it in chunks so the
+        file never has to be fully materialized in memory. Large files are uploaded
+        as blocks, up to ``max_concurrency`` at a time.
+        """
         blob_client = self.container_client.get_blob_client(file_id)
         
         # Set content settings to preserve file type
@@ -121,7 +172,9 @@ class BlobFileStorage(FileStorage):
         
         blob_client.upload_blob(
             data=content,
+            length=metadata.size,
             overwrite=True,
+            max_concurrency=self.max_concurrency,
             content_settings=content_settings,
             metadata={
                 "filename": metadata.filename,
@@ -3,6 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 
+from azure.core.credentials import TokenCredential
 from azure.cosmos import CosmosClient
 from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosResourceNotFoundError
 from azure.identity import DefaultAzureCredential
@@ -52,23 +53,31 @@ class CosmosUserService(UserService):
 
     def __init__(
         self,
-        cosmos_endpoint: str,
+        cosmos_endpoint: str | None = None,
         cosmos_key: str | None = None,
         database_name: str = "agentic",
         container_name: str = "users",
         use_managed_identity: bool = False,
+        client: CosmosClient | None = None,
+        credential: TokenCredential | None = None,
     ) -> None:
         """Initialize Cosmos DB user service.
 
         Args:
-            cosmos_endpoint: Cosmos DB endpoint URL
+            cosmos_endpoint: Cosmos DB endpoint URL (required unless client is given)
             cosmos_key: Cosmos DB key (if not using managed identity)
             database_name: Database name
             container_name: Container name for users
             use_managed_identity: Use managed identity for authentication
+            client: Existing Cosmos client to share instead of creating one
+            credential: Shared token credential for managed identity (created if not given)
         """
-        if use_managed_identity:
-            credential = DefaultAzureCredential()
+        if client is not None:
+            self.client = client
+        elif not cosmos_endpoint:
+            raise ValueError("cosmos_endpoint is required when no client is given")
+        elif use_managed_identity:
+            credential = credential or DefaultAzureCredential()
             self.client = CosmosClient(cosmos_endpoint, credential)
         else:
             if not cosmos_key: